@@ -193,15 +193,26 @@ def gather_runtime_info(fname):
     """
     runtime = Runtime(rss_peak_gb=None, vms_peak_gb=None, cpu_peak_percent=None)
 
-    # Read .prof file in and set runtime values
-    data = [
-        [float(el) for el in line.strip().split(",")]
-        for line in Path(fname).read_text().splitlines()
-    ]
-    if data:
-        runtime.rss_peak_gb = max([val[2] for val in data]) / 1024
-        runtime.vms_peak_gb = max([val[3] for val in data]) / 1024
-        runtime.cpu_peak_percent = max([val[1] for val in data])
+    # Stream the .prof file and keep running peaks, rather than loading
+    # every sample into memory
+    cpu_peak = rss_peak = vms_peak = None
+    with open(fname) as fp:
+        for line in fp:
+            if not line.strip():
+                continue
+            # the timestamp column is not needed, so it is never converted
+            _, cpu, rss, vms = line.split(",")
+            cpu, rss, vms = float(cpu), float(rss), float(vms)
+            if cpu_peak is None:
+                cpu_peak, rss_peak, vms_peak = cpu, rss, vms
+            else:
+                cpu_peak = max(cpu_peak, cpu)
+                rss_peak = max(rss_peak, rss)
+                vms_peak = max(vms_peak, vms)
+    if cpu_peak is not None:
+        runtime.rss_peak_gb = rss_peak / 1024
+        runtime.vms_peak_gb = vms_peak / 1024
+        runtime.cpu_peak_percent = cpu_peak
 
     """
     runtime.prof_dict = {
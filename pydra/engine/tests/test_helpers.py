@@ -19,6 +19,7 @@ from ..helpers import (
     parse_copyfile,
     argstr_formatting,
     parse_format_string,
+    gather_runtime_info,
 )
 from ...utils.hash import hash_function
 from ..core import Workflow
@@ -362,3 +363,23 @@ def test_parse_format_string7():
     assert parse_format_string(
         "{a1_field} {b2_field:02f} -test {c3_field[c]} -me {d4_field[0]}"
     ) == {"a1_field", "b2_field", "c3_field", "d4_field"}
+
+
+def test_gather_runtime_info(tmp_path):
+    log = tmp_path / "proc.log"
+    log.write_text(
+        "1.0,10.0,512.0,2048.0\n" "2.0,50.0,1024.0,1024.0\n" "3.0,5.0,256.0,512.0\n"
+    )
+    runtime = gather_runtime_info(log)
+    assert runtime.cpu_peak_percent == 50.0
+    assert runtime.rss_peak_gb == 1.0
+    assert runtime.vms_peak_gb == 2.0
+
+
+def test_gather_runtime_info_empty(tmp_path):
+    log = tmp_path / "proc.log"
+    log.write_text("")
+    runtime = gather_runtime_info(log)
+    assert runtime.cpu_peak_percent is None
+    assert runtime.rss_peak_gb is None
+    assert runtime.vms_peak_gb is None
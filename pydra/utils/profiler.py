@@ -1,10 +1,13 @@
 """Utilities to keep track of performance and resource utilization."""
 
+import logging
 from pathlib import Path
 import psutil
 import threading
 from time import time
 
+logger = logging.getLogger("pydra")
+
 # Init variables
 _MB = 1024.0**2
 
@@ -124,7 +127,6 @@ def log_nodes_cb(node, status):
         return
 
     # Import packages
-    import logging
     import json
 
     status_dict = {
@@ -195,7 +197,7 @@ def get_max_resources_used(pid, mem_mb, num_threads, pyfunc=False):
         mem_mb = max(mem_mb, _get_ram_mb(pid, pyfunc=pyfunc))
         num_threads = max(num_threads, _get_num_threads(pid))
     except Exception as exc:
-        print("Could not get resources used by process.\n%s", exc)
+        logger.debug("Could not get resources used by process.\n%s", exc)
 
     return mem_mb, num_threads
 